@@ -1,9 +1,10 @@
 from __future__ import annotations
+from functools import lru_cache
 import os
-from typing import Dict, List, Tuple, Type
+from typing import TYPE_CHECKING, Dict, List, Tuple, Type
 
-import yaml
-from schema import Schema, Use, Optional, Or
+if TYPE_CHECKING:
+    from schema import Schema
 
 from .config_language_mapping import ConfigLanguageMapping
 from .name_converter import NamingConventionType
@@ -51,6 +52,15 @@ _DISTRIBUTION_TYPE_GIT = 'git'
 # Load the glue.
 _LANGUAGE_MAPPINGS = ConfigLanguageMapping.get_mappings()
 
+# Naming convention strings mapped to their enum values.
+_NAMING_CONVENTIONS = {
+    'snake': NamingConventionType.SNAKE_CASE,
+    'screaming_snake': NamingConventionType.SCREAMING_SNAKE_CASE,
+    'camel': NamingConventionType.CAMEL_CASE,
+    'pascal': NamingConventionType.PASCAL_CASE,
+    'kebap': NamingConventionType.KEBAP_CASE,
+}
+
 
 class UnknownPropertyTypeException(Exception):
     def __init__(self, property_type: str):
@@ -82,6 +92,39 @@ class AliasAlreadyInUseException(Exception):
         super().__init__(f'The include-alias \'{alias}\' is already in use')
 
 
+@lru_cache(maxsize=1)
+def _yaml_loader():
+    """
+    Returns the YAML loader class to use. yaml is imported on demand, so callers which never
+    parse a config don't pay the PyYAML import cost.
+
+    :return: YAML loader class.
+    :rtype:  type
+    """
+    # Prefer the libyaml-backed loader as it parses considerably faster. Fall back to the
+    # pure-Python loader if PyYAML has been built without libyaml support.
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
+# Index the language mappings by name and type once at import time to avoid a linear scan
+# per lookup. Duplicated mappings are a package error, therefore they already get detected here.
+_LANGUAGE_BY_NAME: Dict[str, LanguageType] = {}
+_CONFIG_BY_TYPE: Dict[LanguageType, Type[LanguageConfigBase]] = {}
+
+for _mapping in _LANGUAGE_MAPPINGS:
+    if _mapping.name in _LANGUAGE_BY_NAME:
+        raise SeveralLanguagesException(_mapping.name)
+    if _mapping.type in _CONFIG_BY_TYPE:
+        raise SeveralLanguageConfigsException(_mapping.type)
+
+    _LANGUAGE_BY_NAME[_mapping.name] = _mapping.type
+    _CONFIG_BY_TYPE[_mapping.type] = _mapping.config_type
+
+
 class Config:
     """
     Handles the config evaluation by parsing the provided YAML string via the parse-method.
@@ -139,13 +182,10 @@ class Config:
         with open(path, 'r') as f:
             content = f.read()
 
-        # Prepare config name.
-        last_part = path.replace(r'\\', '/').split('/')[-1]
+        # Prepare config name. Backslashes get normalized first so that Windows style paths are
+        # also handled on POSIX systems.
+        config_name = os.path.splitext(os.path.basename(path.replace('\\', '/')))[0]
 
-        if '.' in last_part:
-            config_name = '.'.join(last_part.split('.')[0:-1])
-        else:
-            config_name = last_part
         return Config._parse(
             content,
             config_name,
@@ -181,7 +221,9 @@ class Config:
         :return: Language configurations which further can be dumped as config files.
         :rtype:  List[LanguageConfigBase]
         """
-        yaml_object = yaml.safe_load(content)
+        import yaml  # Imported on demand to keep the module import lightweight.
+
+        yaml_object = yaml.load(content, Loader=_yaml_loader())
         validated_object = Config._schema().validate(yaml_object)
         language_configs: List[LanguageConfigBase] = []
         properties: List[Property] = []
@@ -219,8 +261,8 @@ class Config:
                 name=property[_LANGUAGE_KEY_NAME],
                 value=property[_PROPERTY_KEY_VALUE],
                 property_type=property[_LANGUAGE_KEY_TYPE],
-                hidden=property[_PROPERTY_KEY_HIDDEN] if _PROPERTY_KEY_HIDDEN in property else None,
-                comment=property[_PROPERTY_KEY_COMMENT] if _PROPERTY_KEY_COMMENT in property else None,
+                hidden=property.get(_PROPERTY_KEY_HIDDEN),
+                comment=property.get(_PROPERTY_KEY_COMMENT),
                 namespace=namespace,
             ))
 
@@ -229,22 +271,22 @@ class Config:
             for language in validated_object[_KEY_LANGUAGES]:
                 naming_conventions = LanguageConfigNamingConventions()
                 language_type = language[_LANGUAGE_KEY_TYPE]
-                indent = language[_LANGUAGE_KEY_INDENT] if _LANGUAGE_KEY_INDENT in language else None
-                transform = language[_LANGUAGE_KEY_TRANSFORM] if _LANGUAGE_KEY_TRANSFORM in language else None
+                indent = language.get(_LANGUAGE_KEY_INDENT)
+                transform = language.get(_LANGUAGE_KEY_TRANSFORM)
 
                 # Evaluate file naming-convention.
                 naming_conventions.file_naming_convention = Config._evaluate_naming_convention_type(
-                    language[_LANGUAGE_KEY_FILE_NAMING] if _LANGUAGE_KEY_FILE_NAMING in language else None
+                    language.get(_LANGUAGE_KEY_FILE_NAMING)
                 )
 
                 # Evaluate properties naming-convention.
                 naming_conventions.properties_naming_convention = Config._evaluate_naming_convention_type(
-                    language[_LANGUAGE_KEY_PROPERTY_NAMING] if _LANGUAGE_KEY_PROPERTY_NAMING in language else None
+                    language.get(_LANGUAGE_KEY_PROPERTY_NAMING)
                 )
 
                 # Evaluate type naming-convention.
                 naming_conventions.type_naming_convention = Config._evaluate_naming_convention_type(
-                    language[_LANGUAGE_KEY_TYPE_NAMING] if _LANGUAGE_KEY_TYPE_NAMING in language else None
+                    language.get(_LANGUAGE_KEY_TYPE_NAMING)
                 )
                 config_type = Config._evaluate_config_type(language_type)
 
@@ -264,13 +306,19 @@ class Config:
         return language_configs, properties
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def _schema() -> Schema:
         """
-        Returns the config validation schema.
+        Returns the config validation schema. As the schema never changes, it only gets built on
+        the first call and is re-used afterwards.
 
         :return: Config validation schema.
         :rtype:  Schema
         """
+        # Imported on demand (and therefore only once due to the memoization) to keep the
+        # module import lightweight.
+        from schema import Schema, Use, Optional, Or
+
         return Schema({
             Optional(_KEY_INCLUDES): [{
                 _INCLUDE_KEY_PATH: str,
@@ -323,22 +371,15 @@ class Config:
         :param language: Language to generate a config for (e.g., java | typescript | ...).
         :type language:  str
 
-        :raises UnknownLanguageException:  Raised if an unsupported language was used in the config.
-        :raises SeveralLanguagesException: Raised if several mappings were found for the requested language. If this
-                                           error arises, it's a package error. Please open an issue at
-                                           https://github.com/monstermichl/confluent/issues.
+        :raises UnknownLanguageException: Raised if an unsupported language was used in the config.
 
         :return: The corresponding LanguageType enum value.
         :rtype:  LanguageType
         """
-        found = [mapping.type for mapping in _LANGUAGE_MAPPINGS if mapping.name == language]
-        length = len(found)
-
-        if length == 0:
+        try:
+            return _LANGUAGE_BY_NAME[language]
+        except KeyError:
             raise UnknownLanguageException(language)
-        elif length > 1:
-            raise SeveralLanguagesException(language)
-        return found[0]
     
     @staticmethod
     def _evaluate_config_type(language_type: LanguageType) -> Type[LanguageConfigBase]:
@@ -348,24 +389,17 @@ class Config:
         :param language_type: Language type to search the corresponding language config for (e.g., LanguageType.JAVA).
         :type language_type:  LanguageType
 
-        :raises NoLanguageConfigException:       Raised if no language config mapping was provided for the specified
-                                                 language type. If this error arises, it's a package error. Please open
-                                                 an issue at https://github.com/monstermichl/confluent/issues.
-        :raises SeveralLanguageConfigsException: Raised if several language config mappings were found for the specified
-                                                 language type. If this error arises, it's a package error. Please open
-                                                 an issue at https://github.com/monstermichl/confluent/issues.
+        :raises NoLanguageConfigException: Raised if no language config mapping was provided for the specified
+                                           language type. If this error arises, it's a package error. Please open
+                                           an issue at https://github.com/monstermichl/confluent/issues.
 
         :return: The corresponding LanguageConfigBase derivate type (e.g., Type[JavaConfig]).
         :rtype:  Type[LanguageConfigBase]
         """
-        found = [mapping.config_type for mapping in _LANGUAGE_MAPPINGS if mapping.type == language_type]
-        length = len(found)
-
-        if length == 0:
+        try:
+            return _CONFIG_BY_TYPE[language_type]
+        except KeyError:
             raise NoLanguageConfigException(language_type)
-        elif length > 1:
-            raise SeveralLanguageConfigsException('Several language configs found')
-        return found[0]
     
     @staticmethod
     def _evaluate_distributors(
@@ -392,9 +426,7 @@ class Config:
             credentials_map[distributor_credential.distribution_alias] = distributor_credential
 
         # Get distributions config if provided.
-        distributor_configs = language_config[_LANGUAGE_KEY_DISTRIBUTIONS] \
-            if _LANGUAGE_KEY_DISTRIBUTIONS in language_config \
-            else None
+        distributor_configs = language_config.get(_LANGUAGE_KEY_DISTRIBUTIONS)
         
         # Check if distributions are provided and 
         if distributor_configs:
@@ -406,7 +438,7 @@ class Config:
 
             for config in distributor_configs:
                 def from_config(key: str):
-                    return config[key] if key in config else None
+                    return config.get(key)
                 type = from_config(_LANGUAGE_KEY_TYPE)
 
                 # Build Git distributor.
@@ -417,9 +449,9 @@ class Config:
                     alias = from_config(_LANGUAGE_KEY_AS)
 
                     # If the alias is available in the credentials-map, use provided values.
-                    if alias in credentials_map:
-                        credential = credentials_map[alias]
+                    credential = credentials_map.get(alias)
 
+                    if credential:
                         # Overwrite YAML defined user and password value if provided.
                         if credential.user:
                             user = credential.user
@@ -452,14 +484,5 @@ class Config:
         :return: The corresponding NamingConventionType enum value.
         :rtype:  NamingConventionType
         """
-        if naming_convention == 'snake':
-            naming_convention = NamingConventionType.SNAKE_CASE
-        elif naming_convention == 'screaming_snake':
-            naming_convention = NamingConventionType.SCREAMING_SNAKE_CASE
-        elif naming_convention == 'camel':
-            naming_convention = NamingConventionType.CAMEL_CASE
-        elif naming_convention == 'pascal':
-            naming_convention = NamingConventionType.PASCAL_CASE
-        elif naming_convention == 'kebap':
-            naming_convention = NamingConventionType.KEBAP_CASE
-        return naming_convention
+        # Unknown conventions (e.g., None) are passed through as before.
+        return _NAMING_CONVENTIONS.get(naming_convention, naming_convention)
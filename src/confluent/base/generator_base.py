@@ -55,7 +55,8 @@ class GeneratorBase(ABC):
         self.set_indent(indent)
 
         # Add properties one by one.
-        [self.add_property(property) for property in properties]
+        for property in properties:
+            self.add_property(property)
 
     def add_property(self, property: Property):
         """
@@ -113,8 +114,7 @@ class GeneratorBase(ABC):
         self._apply_transformation(properties_copy)
 
         # Substitute property values.
-        for property in properties_copy:
-            Property.substitute(property, properties_copy)
+        Property.substitute_all(properties_copy)
 
         # Remove hidden properties.
         properties_copy = [property for property in properties_copy if not property.hidden]
@@ -117,8 +117,10 @@ class LanguageConfigBase(ABC):
         path = path.rstrip('/').rstrip('\\')  # Strip right-side slashes.
         path = f'{path}/{self.config_info.file_name_full}'
 
-        with open(path, 'w') as f:
-            f.write(self.dump())
+        # Write the dumped data in binary mode to hand the full buffer to the OS in one shot
+        # instead of going through the TextIOWrapper machinery.
+        with open(path, 'wb') as f:
+            f.write(self.dump().encode('utf-8'))
         return self
     
     def distribute(self) -> LanguageConfigBase:
@@ -130,7 +132,8 @@ class LanguageConfigBase(ABC):
         """
         data = self.dump()
 
-        [distributor.distribute(self.config_info.file_name_full, data) for distributor in self.distributors]            
+        for distributor in self.distributors:
+            distributor.distribute(self.config_info.file_name_full, data)
         return self
     
     @abstractmethod
@@ -1,10 +1,48 @@
 from __future__ import annotations
-from typing import List
+import hashlib
+import os
+from typing import Callable, Dict, List, Tuple
 
 from .language_config_base import LanguageConfigBase
 from .config import Config
 from .distributor_base import DistributorCredential
 
+# Cache evaluated language configs to avoid re-parsing unchanged input if the same config
+# gets orchestrated several times (e.g., within a multi-build setup).
+_CACHE_SIZE = 64
+_read_cache: Dict[Tuple, List[LanguageConfigBase]] = {}
+_parse_cache: Dict[Tuple, List[LanguageConfigBase]] = {}
+
+
+def _cached_language_configs(
+    cache: Dict[Tuple, List[LanguageConfigBase]],
+    key: Tuple,
+    create: Callable[[], List[LanguageConfigBase]],
+) -> List[LanguageConfigBase]:
+    """
+    Looks up the language configs for the provided key in the provided cache and creates them
+    via the create callout if they haven't been cached yet.
+
+    :param cache:  Cache to look up the language configs in.
+    :type cache:   Dict[Tuple, List[LanguageConfigBase]]
+    :param key:    Cache key which identifies the config input.
+    :type key:     Tuple
+    :param create: Callout to create the language configs on a cache miss.
+    :type create:  Callable[[], List[LanguageConfigBase]]
+
+    :return: Shallow copy of the cached language config list.
+    :rtype:  List[LanguageConfigBase]
+    """
+    if key not in cache:
+        # Evict the oldest entry if the cache limit has been reached.
+        if len(cache) >= _CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = create()
+
+    # Return a copy of the list to keep the cached list itself unmodifiable from the outside.
+    return list(cache[key])
+
+
 class Orchestrator:
 
     def __init__(self, language_configs: List[LanguageConfigBase]):
@@ -33,7 +71,8 @@ class Orchestrator:
         :return: The current Orchestrator instance.
         :rtype:  Orchestrator
         """
-        [config.write(path) for config in self.language_configs]
+        for config in self.language_configs:
+            config.write(path)
         return self
     
     def distribute(self) -> Orchestrator:
@@ -43,7 +82,8 @@ class Orchestrator:
         :return: The current Orchestrator instance.
         :rtype:  Orchestrator
         """
-        [config.distribute() for config in self.language_configs]
+        for config in self.language_configs:
+            config.distribute()
         return self
 
     @staticmethod
@@ -51,13 +91,27 @@ class Orchestrator:
         """
         Reads the provided YAML configuration file and generates a list of language configurations.
 
+        NOTE: The evaluated language configs are cached based on the root config file's path,
+        modification time and size. Changes to files referenced via the includes-section therefore
+        only get picked up after the root config file changed as well. To force a re-evaluation,
+        touch the root config file.
+
         :param path: Path to load the YAML file from (see example/test-config.yaml for configuration details).
         :type path:  str
 
         :return: Orchestrator instance.
         :rtype:  Orchestrator
         """
-        return Orchestrator(Config.read(path, distributor_credentials))
+        # Only use the cache if no credentials are involved as credentials influence the created distributors.
+        if distributor_credentials:
+            return Orchestrator(Config.read(path, distributor_credentials))
+        stat_result = os.stat(path)
+
+        return Orchestrator(_cached_language_configs(
+            _read_cache,
+            (os.path.abspath(path), stat_result.st_mtime_ns, stat_result.st_size),
+            lambda: Config.read(path, distributor_credentials),
+        ))
 
     @staticmethod
     def parse_config(config: str, config_name: str, distributor_credentials: List[DistributorCredential]=[]) \
@@ -77,4 +131,12 @@ class Orchestrator:
         :return: Orchestrator instance.
         :rtype:  Orchestrator
         """
-        return Orchestrator(Config.parse(config, config_name, distributor_credentials))
+        # Only use the cache if no credentials are involved as credentials influence the created distributors.
+        if distributor_credentials:
+            return Orchestrator(Config.parse(config, config_name, distributor_credentials))
+
+        return Orchestrator(_cached_language_configs(
+            _parse_cache,
+            (hashlib.blake2b(config.encode(), digest_size=16).digest(), config_name),
+            lambda: Config.parse(config, config_name, distributor_credentials),
+        ))
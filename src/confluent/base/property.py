@@ -2,7 +2,7 @@ from __future__ import annotations
 import copy
 import random
 import re
-from typing import Callable, List
+from typing import Callable, Dict, List
 from .property_type import PropertyType
 
 
@@ -27,8 +27,9 @@ class InvalidNamespaceException(Exception):
 
 
 class Property:
-    _PROPERTY_SUBSTITUTION_PATTERN = r'\${((_|[a-zA-Z])(\w|-)*((\.(_|[a-zA-Z])(\w|-)*))?)}'
-    _NAMING_PATTERN = r'^(_|[a-zA-Z])(\w|-)*$'  # Define a general naming pattern.
+    # Compile the patterns once as they are used for each property again.
+    _PROPERTY_SUBSTITUTION_PATTERN = re.compile(r'\${((_|[a-zA-Z])(\w|-)*((\.(_|[a-zA-Z])(\w|-)*))?)}')
+    _NAMING_PATTERN = re.compile(r'^(_|[a-zA-Z])(\w|-)*$')  # Define a general naming pattern.
     _PROPERTY_NAME_PATTERN = _NAMING_PATTERN
     _NAMESPACE_NAME_PATTERN = _NAMING_PATTERN
 
@@ -69,11 +70,11 @@ class Property:
         :raises InvalidNamespaceException:    Raised if an invalid namespace has been provided.
         """
         # Check if the key is a valid variable name.
-        if not re.match(Property._PROPERTY_NAME_PATTERN, name):
+        if not Property._PROPERTY_NAME_PATTERN.match(name):
             raise InvalidVariableNameException(name)
-        
+
         # Check if the key is a valid variable name.
-        if namespace and not re.match(Property._NAMESPACE_NAME_PATTERN, namespace):
+        if namespace and not Property._NAMESPACE_NAME_PATTERN.match(namespace):
             raise InvalidNamespaceException(namespace)
         
         # Make sure that the provided value is valid even if it's a string.
@@ -102,48 +103,208 @@ class Property:
         # Copy properties to avoid messing around with the originals.
         properties_copy = copy.deepcopy(properties)
 
-        def replace(match, _: Property):
+        Property._substitute_with_table(property, Property._substitution_table(properties_copy))
+
+    @staticmethod
+    def substitute_all(properties: List[Property]) -> None:
+        """
+        Substitutes the property references of all provided properties in-place. In contrast to calling
+        substitute for each property separately, the substitution table is only built once for the whole
+        property list.
+
+        :param properties: Properties which's values shall be updated.
+        :type properties:  List[Property]
+
+        :raises UnknownSubstitutionException:   Raised if a requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution (also
+                                                indirectly via a reference cycle).
+        """
+        # Pull the hot fields out of the Property objects once, so the substitution pass itself only
+        # operates on plain lists and dicts instead of going through attribute accesses per match.
+        names = [Property._prepared_property_name(property) for property in properties]
+        namespaces = [property.namespace for property in properties]
+        values = [property.value for property in properties]
+        values_by_name: Dict[str, any] = {}
+
+        for name, value in zip(names, values):
+            values_by_name.setdefault(name, value)
+
+        # Resolve the properties in dependency order (Kahn's algorithm), so that referenced properties
+        # are already fully substituted when they get used, independently of their position within the
+        # config. Each value therefore only needs to be processed once.
+        open_dependencies: List[set] = []
+        dependents: Dict[str, List[int]] = {}
+        ready: List[int] = []
+
+        for i, value in enumerate(values):
+            dependencies = set()
+
+            # Checking for the substitution start sequence first is nearly free and skips the
+            # regex engine for all values without references.
+            if isinstance(value, str) and '${' in value:
+                for groups in Property._PROPERTY_SUBSTITUTION_PATTERN.findall(value):
+                    reference = groups[0]
+
+                    if namespaces[i]:
+                        reference = Property._add_namespace(reference, namespaces[i])
+
+                    # Only known references to other properties are relevant for the ordering. Unknown
+                    # and direct self references get reported during the actual substitution. Each
+                    # reference must only be registered once per property, otherwise a property which
+                    # references the same property several times would be appended to the ready-list
+                    # once per occurrence and thereby corrupt the cycle check below.
+                    if reference != names[i] and reference in values_by_name and reference not in dependencies:
+                        dependencies.add(reference)
+                        dependents.setdefault(reference, []).append(i)
+
+            open_dependencies.append(dependencies)
+
+            if not dependencies:
+                ready.append(i)
+
+        position = 0
+
+        while position < len(ready):
+            i = ready[position]
+            position += 1
+            property = properties[i]
+            property_name = names[i]
+
+            if isinstance(values[i], str) and '${' in values[i]:
+                value = Property._substitute_value(values[i], property_name, namespaces[i], values_by_name)
+                values[i] = Property._convert_substituted_value(value, values[i], property.type)
+
+            # Keep the table in sync with the substituted value for dependent properties.
+            values_by_name[property_name] = values[i]
+
+            # Un-block all properties which waited for the current one.
+            for dependent in dependents.get(property_name, []):
+                dependencies = open_dependencies[dependent]
+                dependencies.discard(property_name)
+
+                if not dependencies:
+                    ready.append(dependent)
+
+        # Properties which could not be processed are part of a reference cycle.
+        if len(ready) < len(properties):
+            raise RecursiveSubstitutionException(next(
+                names[i] for i, dependencies in enumerate(open_dependencies) if dependencies
+            ))
+
+        # Write the resolved values back to the properties.
+        for property, value in zip(properties, values):
+            property.value = value
 
-            def add_namespace(property_name, namespace):
-                return f'{namespace}.{property_name}'
+    @staticmethod
+    def _add_namespace(property_name: str, namespace: str) -> str:
+        return f'{namespace}.{property_name}'
+
+    @staticmethod
+    def _prepared_property_name(property: Property) -> str:
+        # Incorporate namespace into property name.
+        return Property._add_namespace(property.name, property.namespace) \
+            if property.namespace else property.name
+
+    @staticmethod
+    def _substitution_table(properties: List[Property]) -> Dict[str, any]:
+        """
+        Indexes the provided properties by their prepared name to avoid a linear scan per substitution.
+
+        :param properties: Properties to build the substitution table from.
+        :type properties:  List[Property]
+
+        :return: Property values keyed by their prepared property name (first occurrence wins).
+        :rtype:  Dict[str, any]
+        """
+        values_by_name = {}
+
+        for property in properties:
+            values_by_name.setdefault(Property._prepared_property_name(property), property.value)
+        return values_by_name
+
+    @staticmethod
+    def _substitute_with_table(property: Property, values_by_name: Dict[str, any]) -> None:
+        """
+        Substitutes the referenced property references based on an already built substitution table.
 
-            # Incorporate namespace into property name.
-            def prepared_property_name(propertyTemp):
-                return add_namespace(propertyTemp.name, propertyTemp.namespace) \
-                    if propertyTemp.namespace else propertyTemp.name
+        :param property:       Property which's value shall be updated.
+        :type property:        Property
+        :param values_by_name: Property values keyed by their prepared property name.
+        :type values_by_name:  Dict[str, any]
+
+        :raises UnknownSubstitutionException:   Raised if the requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+        """
+        if isinstance(property.value, str) and '${' in property.value:
+            value = Property._substitute_value(
+                property.value,
+                Property._prepared_property_name(property),
+                property.namespace,
+                values_by_name,
+            )
+            property.value = Property._convert_substituted_value(value, property.value, property.type)
+
+    @staticmethod
+    def _substitute_value(value: str, property_name: str, namespace: str, values_by_name: Dict[str, any]) -> str:
+        """
+        Substitutes the property references within a single value string.
+
+        :param value:          Value string to substitute the references in.
+        :type value:           str
+        :param property_name:  Prepared name of the property the value belongs to.
+        :type property_name:   str
+        :param namespace:      Namespace of the property the value belongs to.
+        :type namespace:       str
+        :param values_by_name: Property values keyed by their prepared property name.
+        :type values_by_name:  Dict[str, any]
+
+        :raises UnknownSubstitutionException:   Raised if the requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+
+        :return: Value with all references substituted.
+        :rtype:  str
+        """
+        def replace(match: re.Match) -> str:
+            reference = match.group(1)  # E.g. myReplaceString or ti.myReplaceString.
+
+            if namespace:
+                reference = Property._add_namespace(reference, namespace)
 
-            substitution_property_value = match.group(1)  # E.g. myReplaceString or ti.myReplaceString.
-            property_name = prepared_property_name(property)
-            
-            if property.namespace:
-                substitution_property_value = add_namespace(substitution_property_value, property.namespace)
-            
             # Substitute property only if it's not the same property as the one which is currently being processed.
-            if substitution_property_value != property_name:
-                found_properties = [
-                    search_property.value for search_property in properties_copy if
-                    prepared_property_name(search_property) == substitution_property_value
-                ]
-
-                if not found_properties:
-                    raise UnknownSubstitutionException(substitution_property_value)
-                replacement = found_properties[0]
+            if reference != property_name:
+                if reference not in values_by_name:
+                    raise UnknownSubstitutionException(reference)
+                replacement = values_by_name[reference]
             else:
                 # TODO: Handle indirect self reference.
                 raise RecursiveSubstitutionException(
                     f'Property {property_name} must not reference itself!'
                 )
             return f'{replacement}'
-        
-        original_value = property.value
-        Property._replace_property_value(property, replace)
 
+        return Property._PROPERTY_SUBSTITUTION_PATTERN.sub(replace, value)
+
+    @staticmethod
+    def _convert_substituted_value(value: str, original_value: str, property_type: PropertyType) -> any:
+        """
+        Converts a substituted value back to the corresponding property type if substitution changed it.
+
+        :param value:          Substituted value.
+        :type value:           str
+        :param original_value: Value before the substitution.
+        :type original_value:  str
+        :param property_type:  Property type of the corresponding property.
+        :type property_type:   PropertyType
+
+        :return: The possibly converted value.
+        :rtype:  any
+        """
         # Check if value changed due to substitution.
-        if property.value != original_value:
-            # IF type is some kind of number or boolean, evaluate the new string and assign the result to the
-            # current property.
-            if property.type in [PropertyType.INT, PropertyType.FLOAT, PropertyType.DOUBLE, PropertyType.BOOL]:
-                property.value = Property._convert_value(eval(property.value), property.type)
+        if value != original_value:
+            # If type is some kind of number or boolean, evaluate the new string and use the result.
+            if property_type in [PropertyType.INT, PropertyType.FLOAT, PropertyType.DOUBLE, PropertyType.BOOL]:
+                value = Property._convert_value(eval(value), property_type)
+        return value
 
     @staticmethod
     def _convert_value(value: any, property_type: PropertyType) -> any:
@@ -176,9 +337,10 @@ class Property:
         def callout_wrapper(match: re.Match) -> str:
             return callout(match, property)
 
-        if isinstance(property.value, str):
+        # Only run the regex engine if the value can contain a substitution at all.
+        if isinstance(property.value, str) and '${' in property.value:
             # Replace all occurrences.
-            property.value = re.sub(Property._PROPERTY_SUBSTITUTION_PATTERN, callout_wrapper, property.value)
+            property.value = Property._PROPERTY_SUBSTITUTION_PATTERN.sub(callout_wrapper, property.value)
 
     @staticmethod
     def _is_valid_number_substitution(value: any) -> bool:
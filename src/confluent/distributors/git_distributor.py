@@ -173,9 +173,9 @@ class GitDistributor(DistributorBase):
                     target_file_path = os.path.join(self._target_path, file_name)
                     target_file_path_full = os.path.join(temp_dir, target_file_path)
 
-                    # Write data to target file.
-                    with open(target_file_path_full, 'w') as f:
-                        f.write(data)
+                    # Write data to target file (in binary mode to avoid the text-layer overhead).
+                    with open(target_file_path_full, 'wb') as f:
+                        f.write(data.encode('utf-8'))
 
                     # Add changes.
                     code, _, stderr = execute_commands(*[
@@ -9,6 +9,41 @@ from ..base.property import Property
 from ..base.property_type import PropertyType
 
 
+# Translation table to escape characters which are problematic within Java string literals.
+# str.translate walks the value in a single pass instead of one scan per replace call.
+_JAVA_STRING_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+
+def _string_value(value: str) -> str:
+    return f'"{value.translate(_JAVA_STRING_ESCAPES)}"'  # Escape and wrap in quotes.
+
+
+# Java type strings and value formatters per property type. Mapping them once at module
+# scope avoids running through an if-chain for every single property.
+_JAVA_TYPES = {
+    PropertyType.BOOL: 'boolean',
+    PropertyType.INT: 'int',
+    PropertyType.FLOAT: 'float',
+    PropertyType.DOUBLE: 'double',
+    PropertyType.STRING: 'String',
+    PropertyType.REGEX: 'String',
+}
+_JAVA_VALUES = {
+    PropertyType.BOOL: lambda value: 'true' if value else 'false',
+    PropertyType.INT: lambda value: value,
+    PropertyType.FLOAT: lambda value: f'{value}f',
+    PropertyType.DOUBLE: lambda value: f'{value}d',
+    PropertyType.STRING: _string_value,
+    PropertyType.REGEX: _string_value,
+}
+
+
 class JavaGenerator(GeneratorBase):
     """
     Java specific generator. For more information about the generator methods, refer to GeneratorBase.
@@ -42,25 +77,10 @@ class JavaGenerator(GeneratorBase):
         return f'public class {type_name} {{'
 
     def _property_in_type(self, property: Property) -> str:
-        type = property.type
-
-        if type == PropertyType.BOOL:
-            type = 'boolean'
-            value = 'true' if property.value else 'false'
-        elif type == PropertyType.INT:
-            type = 'int'
-            value = property.value
-        elif type == PropertyType.FLOAT:
-            type = 'float'
-            value = f'{property.value}f'
-        elif type == PropertyType.DOUBLE:
-            type = 'double'
-            value = f'{property.value}d'
-        elif type == PropertyType.STRING or type == PropertyType.REGEX:
-            type = 'String'
-            value = property.value.replace('\\', '\\\\')  # TODO: Might need to be refined.
-            value = f'"{value}"'  # Wrap in quotes.
-        else:
+        try:
+            type = _JAVA_TYPES[property.type]
+            value = _JAVA_VALUES[property.type](property.value)
+        except KeyError:
             raise Exception('Unknown type')
 
         return f'public final static {type} {property.name} = {value};'
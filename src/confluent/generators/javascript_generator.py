@@ -85,6 +85,8 @@ class JavascriptGenerator(GeneratorBase):
     def _evaluate_export_type(self) -> ExportType:
         export_type = ExportType.ESM  # Default to ESM.
 
+        # Deliberately a membership test instead of dict.get, so an explicitly provided but
+        # invalid value (e.g., export: null) still raises an error below.
         if self._ATTRIBUTE_EXPORT in self._additional_props:
             exception_type_string = self._additional_props[self._ATTRIBUTE_EXPORT]
 
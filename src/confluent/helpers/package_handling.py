@@ -38,13 +38,11 @@ def evaluate_package(package_regex: str, hint: str, **props) -> str:
     :rtype:  str
     """
     ATTRIBUTE_PACKAGE = 'package'
+    package = props.get(ATTRIBUTE_PACKAGE)
 
-    if ATTRIBUTE_PACKAGE not in props:
+    if package is None:
         raise NoPackageNameException()
-    else:
-        package = props[ATTRIBUTE_PACKAGE]
-    
-    if not package:
+    elif not package:
         raise EmptyPackageNameException()
     elif not re.match(package_regex, package):
         raise InvalidPackageNameException(package, hint)
@@ -3,6 +3,7 @@ import os
 import pathlib
 import re
 import shutil
+import tempfile
 from typing import List, Type
 import unittest
 
@@ -10,6 +11,8 @@ from src.confluent import Orchestrator
 from src.confluent.base.language_config_base import LanguageConfigBase
 from src.confluent.base.language_type import LanguageType
 from src.confluent.base.distributor_base import DistributorCredential
+from src.confluent.base.property import Property, RecursiveSubstitutionException
+from src.confluent.base.property_type import PropertyType
 from src.confluent.generators.java_generator import JavaGenerator
 from src.confluent.generators.javascript_generator import JavascriptGenerator
 from src.confluent.generators.typescript_generator import TypescriptGenerator
@@ -71,9 +74,8 @@ class TestGenerator(unittest.TestCase):
         OUTPUT_DIR = path.join(self._test_path, 'test_output')
         orchestrator = Orchestrator.read_config(self._test_config_path)
 
-        if not os.path.isdir(OUTPUT_DIR):
-            os.mkdir(OUTPUT_DIR)
-        
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+
         # Write all configs to the output folder.
         orchestrator.write(OUTPUT_DIR)
 
@@ -87,6 +89,78 @@ class TestGenerator(unittest.TestCase):
         for config in orchestrator.language_configs:
             self.assertIn(config.config_info.file_name_full, files)
 
+    def test_read_config_caching(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = path.join(temp_dir, 'test-config.yaml')
+
+            shutil.copy(self._test_config_path, config_path)
+            shutil.copy(path.join(self._test_path, '..', 'example/test-include.yaml'), temp_dir)
+
+            orchestrator_first = Orchestrator.read_config(config_path)
+            orchestrator_second = Orchestrator.read_config(config_path)
+
+            # An unchanged config file re-uses the cached language configs.
+            self.assertIsNot(orchestrator_first, orchestrator_second)
+
+            for config_first, config_second in zip(
+                orchestrator_first.language_configs,
+                orchestrator_second.language_configs,
+            ):
+                self.assertIs(config_first, config_second)
+
+            # Changing the config file invalidates the cache entry.
+            with open(config_path, 'a') as f:
+                f.write('\n')
+            orchestrator_third = Orchestrator.read_config(config_path)
+
+            for config_first, config_third in zip(
+                orchestrator_first.language_configs,
+                orchestrator_third.language_configs,
+            ):
+                self.assertIsNot(config_first, config_third)
+
+            # Provided credentials bypass the cache as they influence the created distributors.
+            credential = DistributorCredential('git-monstermichl', None, 'password')
+            orchestrator_fourth = Orchestrator.read_config(config_path, [credential])
+            orchestrator_fifth = Orchestrator.read_config(config_path, [credential])
+
+            for config_fourth, config_fifth in zip(
+                orchestrator_fourth.language_configs,
+                orchestrator_fifth.language_configs,
+            ):
+                self.assertIsNot(config_fourth, config_fifth)
+
+    def test_substitute_chained_references(self):
+        properties = [
+            Property('a', '${b}', PropertyType.STRING),
+            Property('b', '${c}', PropertyType.STRING),
+            Property('c', 'value', PropertyType.STRING),
+        ]
+        Property.substitute_all(properties)
+
+        self.assertEqual(properties[0].value, 'value')
+        self.assertEqual(properties[1].value, 'value')
+        self.assertEqual(properties[2].value, 'value')
+
+    def test_substitute_reference_cycle(self):
+        properties = [
+            Property('a', '${b}', PropertyType.STRING),
+            Property('b', '${a}', PropertyType.STRING),
+        ]
+        self.assertRaises(RecursiveSubstitutionException, Property.substitute_all, properties)
+
+    def test_substitute_duplicated_reference_does_not_mask_cycle(self):
+        # Regression: properties which reference the same property several times must not
+        # mask a reference cycle between other properties.
+        properties = [
+            Property('a', '${b}', PropertyType.STRING),
+            Property('b', '${a}', PropertyType.STRING),
+            Property('c', '${d} ${d}', PropertyType.STRING),
+            Property('d', 'x', PropertyType.STRING),
+            Property('e', '${d} ${d}', PropertyType.STRING),
+        ]
+        self.assertRaises(RecursiveSubstitutionException, Property.substitute_all, properties)
+
     def test_git_distribution(self):
         # Get secret from environment variables.
         credential = DistributorCredential('git-monstermichl', None, os.environ['SECRET'])